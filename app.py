@@ -1,9 +1,11 @@
+import io
+
 import streamlit as st
 import pandas as pd
 from pathlib import Path
 
-from pii_detection import file_scanner, pii_detector
-from risk_scoring.pii_classification import classify_pii_dicts
+from pii_detection import pii_detector
+from risk_scoring.pii_classification import classify_pii_matches
 from utils import temp_storage
 
 # Page config
@@ -36,46 +38,43 @@ def analyze_uploaded_file(uploaded_file):
         overall_score: int 0–100
         risk_level: str ("Low", "Medium", "High")
     """
-    raw_bytes = uploaded_file.getvalue()
-
-    # Scan bytes into LineRecord stream.
-    records_iter = list(
-        file_scanner.scan_bytes(
-            raw_bytes,
-            filename=uploaded_file.name,
-        )
-    )
-
-    # Detect PII dictionaries.
-    pii_dicts = pii_detector.detect_pii_dicts(records_iter)
+    # Every finding comes from this one upload, so resolve its display name once and
+    # use it as the detection filename label.
+    display_name = Path(uploaded_file.name).name
+
+    # Stream-decode the upload and detect PII line by line, without
+    # copying the payload via getvalue() or decoding it all at once.
+    uploaded_file.seek(0)
+    stream = io.TextIOWrapper(uploaded_file, encoding="utf-8", errors="replace", newline="")
+    try:
+        matches = list(pii_detector.detect_pii_in_stream(stream, filename=display_name))
+    finally:
+        # Detach so closing the wrapper does not close Streamlit's upload buffer.
+        stream.detach()
 
     # If nothing found, return empty results and low risk.
-    if not pii_dicts:
+    if not matches:
         empty_df = pd.DataFrame(columns=["Type", "Value", "File", "Line", "Risk"])
         return empty_df, 0, "Low"
 
-    # Classify PII into risk levels / severity weights.
-    classified = classify_pii_dicts(pii_dicts)
-
-    # Build table for display.
-    display_rows = []
-    severity_scores = []
-    for item in classified:
-        display_rows.append(
-            {
-                "Type": item["type"].title(),
-                "Value": item["value"],
-                "File": Path(item["file"]).name,
-                "Line": item["line_number"],
-                "Risk": item["risk_level"].title(),
-            }
-        )
-        severity_scores.append(float(item["severity_weight"]))
-
-    df = pd.DataFrame(display_rows)
+    # Classify PII into risk levels / severity weights. Matches stay slotted
+    # dataclasses all the way through; only the DataFrame columns are built here.
+    classified = classify_pii_matches(matches)
+
+    # Build table for display column by column, so pandas gets aligned lists
+    # instead of inferring a schema from per-row dicts.
+    df = pd.DataFrame(
+        {
+            "Type": [m.pii_type.title() for m in classified],
+            "Value": [m.value for m in classified],
+            "File": [display_name] * len(classified),
+            "Line": [m.line_number for m in classified],
+            "Risk": [m.risk_level.title() for m in classified],
+        }
+    )
 
     # Simple aggregation: average severity_weight mapped to 0–100.
-    avg_severity = sum(severity_scores) / len(severity_scores)
+    avg_severity = sum(m.severity_weight for m in classified) / len(classified)
     overall_score = int(round(avg_severity * 100))
 
     if overall_score >= 70:
@@ -5,10 +5,12 @@ Core API:
 - scan_path(...): iterate over lines in a single file path
 - scan_paths(...): iterate over lines across multiple paths
 - scan_text_stream(...): iterate over lines from a text stream (file-like object)
+- iter_numbered_lines(...): like scan_text_stream, but yields plain (line_number, line) tuples
 """
 
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Iterator, Optional, TextIO, Union
@@ -24,6 +26,28 @@ class LineRecord:
 PathLike = Union[str, Path]
 
 
+def iter_numbered_lines(
+    stream: TextIO,
+    *,
+    start_line: int = 1,
+    keep_newline: bool = False,
+) -> Iterator[tuple[int, str]]:
+    """
+    Yield (line_number, line) tuples from a text stream, line by line.
+
+    Same line handling as `scan_text_stream`, without building a LineRecord per line;
+    useful when the filename is constant and can be attached by the caller.
+    """
+    if start_line < 1:
+        raise ValueError("start_line must be >= 1")
+
+    if keep_newline:
+        yield from enumerate(stream, start=start_line)
+    else:
+        for line_no, raw in enumerate(stream, start=start_line):
+            yield line_no, raw.rstrip("\r\n")
+
+
 def scan_text_stream(
     stream: TextIO,
     *,
@@ -123,16 +147,21 @@ def scan_bytes(
 ) -> Iterator[LineRecord]:
     """
     Convenience helper for "uploaded" content already in memory as bytes.
+
+    Bytes are decoded incrementally and yielded line by line, so the full decoded
+    text and a list of all lines are never held at once. Line boundaries follow
+    `scan_path` ("\\n", "\\r\\n" or "\\r").
+
+    Legacy: kept for API compatibility. To detect PII in in-memory content, prefer
+    `pii_detector.detect_pii_dicts_in_text(...)`, which skips building LineRecord items.
     """
-    text = data.decode(encoding, errors=errors)
-    # Splitlines keeps semantics clear and avoids platform newline issues.
-    if start_line < 1:
-        raise ValueError("start_line must be >= 1")
-    for i, line in enumerate(text.splitlines(keepends=keep_newline), start=start_line):
-        if keep_newline:
-            yield LineRecord(filename=filename, line_number=i, line=line)
-        else:
-            yield LineRecord(filename=filename, line_number=i, line=line.rstrip("\r\n"))
+    stream = io.TextIOWrapper(io.BytesIO(data), encoding=encoding, errors=errors, newline="")
+    yield from scan_text_stream(
+        stream,
+        filename=filename,
+        start_line=start_line,
+        keep_newline=keep_newline,
+    )
 
 
 def scan_file(file_path: str, *, encoding: str = "utf-8", errors: str = "replace") -> str:
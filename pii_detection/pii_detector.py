@@ -15,10 +15,16 @@ containing PII so that raw values are never written to logs.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Iterator, Literal, Sequence, TypedDict
+from typing import Iterable, Iterator, Literal, Sequence, TextIO, TypedDict
+import io
 import re
 
-from .file_scanner import LineRecord, PathLike, scan_paths
+try:
+    import re2  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    re2 = None
+
+from .file_scanner import LineRecord, PathLike, iter_numbered_lines, scan_paths
 
 
 PiiType = Literal["email", "phone", "aadhaar"]
@@ -39,23 +45,33 @@ class PiiDict(TypedDict):
     line_number: int
 
 
+# Pattern sources are compact strings (no re.VERBOSE), built from the fragments below
+# so the same source text feeds both Python `re` and the optional RE2 prefilter.
+# Each builder takes the engine's tokens:
+# - d:     a decimal digit
+# - ws:    class body for whitespace
+# - alpha: class body for letters (matched case-insensitively)
+
+
 # Email regex (practical, not RFC-5322 complete).
 # - local part: letters/digits plus common email punctuation
 # - "@"
 # - domain: labels separated by dots
 # - TLD: 2+ letters
-EMAIL_RE = re.compile(
-    r"""
-    \b                              # word boundary
-    [a-z0-9._%+\-]+                 # local-part (common subset)
-    @
-    [a-z0-9.\-]+                    # domain labels
-    \.
-    [a-z]{2,}                       # top-level domain
-    \b
-    """,
-    flags=re.IGNORECASE | re.VERBOSE,
-)
+def _email_local_char_src(alpha: str) -> str:
+    return "[" + alpha + r"0-9._%+\-]"  # local-part character (common subset)
+
+
+def _email_domain_src(alpha: str) -> str:
+    return (
+        "[" + alpha + r"0-9.\-]+"  # domain labels
+        r"\."
+        "[" + alpha + "]{2,}"  # top-level domain
+    )
+
+
+def _email_src(alpha: str) -> str:
+    return _email_local_char_src(alpha) + "+" "@" + _email_domain_src(alpha)
 
 
 # Phone regex (captures both international and India-like formats).
@@ -68,24 +84,19 @@ EMAIL_RE = re.compile(
 # Notes:
 # - This is intentionally permissive: it aims to *find* likely phone numbers in code/text,
 #   not to validate every possible national numbering plan.
-PHONE_RE = re.compile(
-    r"""
-    (?<!\w)                                     # don't start inside a word
-    (                                           # start full match
-      (?:\+?\s*\d{1,3}[\s\-.()]*)?              # optional country code
-      (?:0[\s\-.()]*)?                          # optional trunk prefix (e.g., 0)
-      (?:                                       # either:
-        (?:[6-9]\d{2}[\s\-.()]*\d{3}[\s\-.()]*\d{4})  # India mobile (grouped 3-3-4)
-        |                                       # or:
-        (?:[6-9]\d{9})                           # India mobile (plain 10 digits)
-        |                                       # or:
-        (?:\d[\d\s\-.()]{6,}\d)                  # general international-ish number
-      )
+def _phone_src(d: str, ws: str) -> str:
+    sep = "[" + ws + r"\-.()]*"
+    return (
+        r"(?:\+?[" + ws + "]*" + d + "{1,3}" + sep + ")?"  # optional country code
+        "(?:0" + sep + ")?"  # optional trunk prefix (e.g., 0)
+        "(?:"  # either:
+        "(?:[6-9]" + d + "{2}" + sep + d + "{3}" + sep + d + "{4})"  # India mobile (grouped 3-3-4)
+        "|"  # or:
+        "(?:[6-9]" + d + "{9})"  # India mobile (plain 10 digits)
+        "|"  # or:
+        "(?:" + d + "[" + d + ws + r"\-.()]{6,}" + d + ")"  # general international-ish number
+        ")"
     )
-    (?!\w)                                      # don't end inside a word
-    """,
-    flags=re.VERBOSE,
-)
 
 
 # Aadhaar-like regex (12 digits; often written as 4-4-4 with spaces).
@@ -93,64 +104,197 @@ PHONE_RE = re.compile(
 # - 12 digits total
 # - first digit is 2-9 (Aadhaar does not start with 0 or 1)
 # This detector is "Aadhaar-like" and does not implement checksum validation.
-#
+def _aadhaar_src(d: str, ws: str) -> str:
+    return (
+        "[2-9]" + d + "{3}"  # first 4 digits (starts 2-9)
+        "[" + ws + r"\-]?"  # optional separator
+        + d + "{4}"  # next 4 digits
+        "[" + ws + r"\-]?"  # optional separator
+        + d + "{4}"  # last 4 digits
+    )
+
+
+_EMAIL_SRC = r"\b" + _email_src("a-z") + r"\b"
+
+_PHONE_SRC = (
+    r"(?<!\w)"  # don't start inside a word
+    "(" + _phone_src(r"\d", r"\s") + ")"  # full match
+    r"(?!\w)"  # don't end inside a word
+)
+
 # Extra guard:
 # - Avoid matching a bare India-country-code + 10 digits (91xxxxxxxxxx) as Aadhaar-like.
-AADHAAR_RE = re.compile(
-    r"""
-    (?<!\w)                 # left boundary
-    (?!91\d{10}\b)          # don't treat 91 + 10 digits as Aadhaar-like
-    (                       # capture the value as written
-      [2-9]\d{3}            # first 4 digits (starts 2-9)
-      [\s\-]?               # optional separator
-      \d{4}                 # next 4 digits
-      [\s\-]?               # optional separator
-      \d{4}                 # last 4 digits
-    )
-    (?!\w)                  # right boundary
-    """,
-    flags=re.VERBOSE,
+_AADHAAR_SRC = (
+    r"(?<!\w)"  # left boundary
+    r"(?!91\d{10}\b)"  # don't treat 91 + 10 digits as Aadhaar-like
+    "(" + _aadhaar_src(r"\d", r"\s") + ")"  # capture the value as written
+    r"(?!\w)"  # right boundary
 )
 
+EMAIL_RE = re.compile(_EMAIL_SRC, flags=re.IGNORECASE)
+PHONE_RE = re.compile(_PHONE_SRC)
+AADHAAR_RE = re.compile(_AADHAAR_SRC)
+
+# Pieces of EMAIL_RE used by _iter_email_spans:
+# - _EMAIL_AT_DOMAIN_RE: "@" plus the domain, anchored at a given "@"
+# - _EMAIL_LOCAL_RUN_RE: a run of local-part characters, matched on the reversed line
+# - _EMAIL_LOCAL_START_RE: the first word start of a local part that reaches the "@"
+_EMAIL_AT_DOMAIN_RE = re.compile("@" + _email_domain_src("a-z") + r"\b", flags=re.IGNORECASE)
+_EMAIL_LOCAL_RUN_RE = re.compile(_email_local_char_src("a-z") + "*", flags=re.IGNORECASE)
+_EMAIL_LOCAL_START_RE = re.compile(r"\b" + _email_local_char_src("a-z") + "+@", flags=re.IGNORECASE)
+
+
+# Multi-pattern prefilter (optional, requires google-re2).
+# RE2 has no lookarounds, so it cannot run the patterns above as written. Instead a
+# single RE2 Set scans each line once with lookaround-free *supersets* of the three
+# patterns and reports which of them can possibly match; only those are then run
+# through Python `re` for the exact spans. Tokens are widened so the supersets stay
+# supersets: Python's `\d`/`\s` are Unicode-aware, and under IGNORECASE `[a-z]` also
+# matches U+0130/U+0131, which RE2's case folding does not.
+_EMAIL_ID, _AADHAAR_ID, _PHONE_ID = 0, 1, 2
+
+_RE2_DIGIT = r"\p{Nd}"
+_RE2_SPACE = r"\s\p{Z}\x0b\x1c-\x1f\x85"
+_RE2_ALPHA = r"a-z\x{130}\x{131}"
+
+_PREFILTER_SOURCES: tuple[str, ...] = (
+    "(?i)" + _email_src(_RE2_ALPHA),  # _EMAIL_ID
+    _aadhaar_src(_RE2_DIGIT, _RE2_SPACE),  # _AADHAAR_ID
+    _phone_src(_RE2_DIGIT, _RE2_SPACE),  # _PHONE_ID
+)
+
+
+def _build_scanner():
+    """
+    Compile the RE2 prefilter Set, or return None when google-re2 is not installed.
+    """
+    if re2 is None:
+        return None
+    scanner = re2.Set.SearchSet(re2.Options())
+    for src in _PREFILTER_SOURCES:
+        scanner.Add(src)
+    scanner.Compile()
+    return scanner
+
+
+# Built once per process at import. Streamlit reruns re-execute app.py but reuse
+# already-imported modules, so the Set (like the compiled patterns) is not rebuilt.
+_SCANNER = _build_scanner()
+
+
+# Every pattern needs an "@" (email) or a decimal digit (aadhaar, phone), so lines
+# without either can be skipped before any regex runs. A compiled search is faster
+# here than a Python-level character check, and `\d` covers non-ASCII digits too.
+_PII_TRIGGER_RE = re.compile(r"[@\d]")
+
+
+# Byte values to delete so that only ASCII digits remain (see _count_digits).
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+
+def _count_digits(s: str) -> int:
+    if s.isascii():
+        return len(s.encode("ascii").translate(None, _NON_DIGIT_BYTES))
+    # Python's \d also matches non-ASCII decimal digits.
+    return sum(map(str.isdecimal, s))
 
-def _iter_matches_for_line(filename: str, line_number: int, line: str) -> Iterator[PiiMatch]:
-    reserved_spans: list[tuple[int, int]] = []
 
-    def overlaps_any(span: tuple[int, int]) -> bool:
-        s1, e1 = span
-        for s2, e2 in reserved_spans:
-            if s1 < e2 and s2 < e1:
-                return True
-        return False
+def _overlaps_any(span: tuple[int, int], reserved_spans: list[tuple[int, int]]) -> bool:
+    s1, e1 = span
+    for s2, e2 in reserved_spans:
+        if s1 < e2 and s2 < e1:
+            return True
+    return False
 
-    for m in EMAIL_RE.finditer(line):
-        reserved_spans.append(m.span(0))
-        yield PiiMatch("email", m.group(0), filename, line_number)
+
+def _iter_email_spans(line: str) -> Iterator[tuple[int, int]]:
+    """
+    Yield the spans of EMAIL_RE.finditer(line), in time linear in the line length.
+
+    EMAIL_RE alone is quadratic on long runs of local-part characters: it retries
+    from every word start in the run and rescans it to the end, whether or not an
+    "@" follows it (e.g. "+1" * 5_000 + " a@b.co", or "a." * 5_000 + "@"). Every
+    match holds exactly one "@", so the scan is anchored on each "@" instead: the
+    domain is matched once after it, and the start is searched only within the
+    local-part run just before it. Runs between consecutive "@"s do not overlap,
+    so each character is looked at a bounded number of times.
+    """
+    at = line.find("@")
+    if at < 0:
+        return
+    reversed_line = line[::-1]
+    n = len(line)
+    pos = 0  # end of the previous match; finditer never starts before it
+    while at >= 0:
+        domain = _EMAIL_AT_DOMAIN_RE.match(line, at)
+        if domain is not None:
+            # Matching from n - at in the reversed line walks back from line[at - 1].
+            run = _EMAIL_LOCAL_RUN_RE.match(reversed_line, n - at)
+            start = _EMAIL_LOCAL_START_RE.search(line, max(pos, at - len(run.group(0))), at + 1)
+            if start is not None:
+                pos = domain.end()
+                yield start.start(), pos
+        at = line.find("@", at + 1)
+
+
+def _iter_matches_for_line(
+    line: str,
+    reserved_spans: list[tuple[int, int]],
+) -> Iterator[tuple[PiiType, str]]:
+    """
+    Yield (pii_type, value) pairs for one line. `reserved_spans` is scratch space
+    owned by the caller; it must be empty on entry and is reused across lines.
+    """
+    if _SCANNER is not None:
+        candidates = _SCANNER.Match(line)
+        if not candidates:
+            return
+        check_email = _EMAIL_ID in candidates
+        check_aadhaar = _AADHAAR_ID in candidates
+        check_phone = _PHONE_ID in candidates
+    else:
+        check_email = "@" in line
+        check_aadhaar = check_phone = True
+
+    if check_email:
+        for span in _iter_email_spans(line):
+            reserved_spans.append(span)
+            yield "email", line[span[0] : span[1]]
 
     # Aadhaar-like before phones; also reserve its span so phones don't re-match it.
-    for m in AADHAAR_RE.finditer(line):
-        reserved_spans.append(m.span(1))
-        yield PiiMatch("aadhaar", m.group(1), filename, line_number)
+    if check_aadhaar:
+        for m in AADHAAR_RE.finditer(line):
+            reserved_spans.append(m.span(1))
+            yield "aadhaar", m.group(1)
+
+    if not check_phone:
+        return
 
     for m in PHONE_RE.finditer(line):
-        if overlaps_any(m.span(1)):
+        if reserved_spans and _overlaps_any(m.span(1), reserved_spans):
             continue
 
         raw = m.group(1).strip()
         # Heuristic: ignore very short "numbers" to reduce false positives.
-        digits = re.sub(r"\D", "", raw)
-        if len(digits) < 7:
+        if _count_digits(raw) < 7:
             continue
 
-        yield PiiMatch("phone", raw, filename, line_number)
+        yield "phone", raw
 
 
 def detect_pii(records: Iterable[LineRecord]) -> Iterator[PiiMatch]:
     """
     Detect PII in an iterable of LineRecord items.
     """
+    has_trigger = _PII_TRIGGER_RE.search
+    reserved_spans: list[tuple[int, int]] = []
     for r in records:
-        yield from _iter_matches_for_line(r.filename, r.line_number, r.line)
+        line = r.line
+        if not has_trigger(line):
+            continue
+        reserved_spans.clear()
+        for pii_type, value in _iter_matches_for_line(line, reserved_spans):
+            yield PiiMatch(pii_type, value, r.filename, r.line_number)
 
 
 def pii_match_to_dict(match: PiiMatch) -> PiiDict:
@@ -179,6 +323,56 @@ def detect_pii_dicts(records: Iterable[LineRecord]) -> list[PiiDict]:
     return pii_matches_to_dicts(detect_pii(records))
 
 
+def _iter_line_hits(numbered_lines: Iterable[tuple[int, str]]) -> Iterator[tuple[int, PiiType, str]]:
+    """
+    Yield (line_number, pii_type, value) for (line_number, line) tuples; callers
+    attach the filename.
+    """
+    has_trigger = _PII_TRIGGER_RE.search
+    reserved_spans: list[tuple[int, int]] = []
+    for line_number, line in numbered_lines:
+        if not has_trigger(line):
+            continue
+        reserved_spans.clear()
+        for pii_type, value in _iter_matches_for_line(line, reserved_spans):
+            yield line_number, pii_type, value
+
+
+def _hits_to_dicts(hits: Iterable[tuple[int, PiiType, str]], filename: str) -> list[PiiDict]:
+    return [{"type": t, "value": v, "file": filename, "line_number": n} for n, t, v in hits]
+
+
+def detect_pii_dicts_in_text(text: str, *, filename: str = "<text>") -> list[PiiDict]:
+    """
+    Detect PII in an in-memory string and return a list of dictionaries.
+
+    Splitting and detection run in one loop, so no intermediate LineRecord or
+    PiiMatch items are built. Line numbers start at 1.
+
+    Lines are split the same way as the stream and file paths (\\n, \\r or \\r\\n), so
+    a given text gets the same line numbers whichever entry point scans it.
+    """
+    return _hits_to_dicts(_iter_line_hits(iter_numbered_lines(io.StringIO(text, newline=""))), filename)
+
+
+def detect_pii_in_stream(stream: TextIO, *, filename: str = "<stream>") -> Iterator[PiiMatch]:
+    """
+    Detect PII in a text stream (file-like object), line by line.
+
+    Lines are read and scanned one at a time, so the stream is never loaded into
+    memory as a whole. Line numbers start at 1.
+    """
+    for n, t, v in _iter_line_hits(iter_numbered_lines(stream)):
+        yield PiiMatch(t, v, filename, n)
+
+
+def detect_pii_dicts_in_stream(stream: TextIO, *, filename: str = "<stream>") -> list[PiiDict]:
+    """
+    Convenience wrapper: detect PII in a text stream and return a list of dictionaries.
+    """
+    return _hits_to_dicts(_iter_line_hits(iter_numbered_lines(stream)), filename)
+
+
 def detect_pii_in_paths(
     paths: Sequence[PathLike],
     *,
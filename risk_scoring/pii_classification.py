@@ -9,15 +9,19 @@ This module is intentionally simple and explainable:
 Typical usage:
 1) Detect PII as dictionaries via `pii_detector.detect_pii_dicts(...)`
 2) Classify those dictionaries via `classify_pii_dicts(...)`
+
+PiiMatch items can also be classified directly via `classify_pii_matches(...)`,
+which returns ClassifiedMatch dataclasses instead of dictionaries.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Dict, Iterable, Literal, Mapping, MutableMapping, Optional, Sequence, TypedDict
+import functools
 import json
 
-from pii_detection.pii_detector import PiiDict, PiiType
+from pii_detection.pii_detector import PiiDict, PiiMatch, PiiType
 
 
 RiskLevel = Literal["low", "medium", "high", "critical"]
@@ -38,6 +42,21 @@ class PiiRiskProfile:
     rationale: str
 
 
+@dataclass(frozen=True, slots=True)
+class ClassifiedMatch:
+    """
+    A PiiMatch with its policy classification attached (see `classify_pii_matches`).
+    """
+
+    pii_type: PiiType
+    value: str
+    filename: str
+    line_number: int
+    risk_level: RiskLevel
+    severity_weight: float
+    rationale: str
+
+
 class PiiClassificationDict(PiiDict):
     risk_level: RiskLevel
     severity_weight: float
@@ -120,18 +139,42 @@ def load_policy_from_json(path: str) -> Dict[PiiType, PiiRiskProfile]:
     return out
 
 
+# Profiles are frozen, so a (type, profile) pair that passed validation stays valid;
+# single-item calls reuse the result instead of re-validating the same profile.
+@functools.lru_cache(maxsize=64)
+def _resolve_profile(pii_type: str, profile: PiiRiskProfile) -> tuple[RiskLevel, float, str]:
+    _validate_profile(pii_type, profile)
+    return profile.risk_level, float(profile.severity_weight), profile.rationale
+
+
+def _resolve_policy(
+    policy: Mapping[PiiType, PiiRiskProfile],
+) -> dict[PiiType, tuple[RiskLevel, float, str]]:
+    """
+    Validate the policy once and resolve each profile to plain values, so batch
+    classifiers don't re-validate and re-read it for every item.
+    """
+    return {t: _resolve_profile(t, p) for t, p in policy.items()}
+
+
 def classify_pii_dict(item: PiiDict, *, policy: Mapping[PiiType, PiiRiskProfile] = DEFAULT_POLICY) -> PiiClassificationDict:
     """
     Add classification fields to one detected PII dictionary.
+
+    The result holds the PiiDict keys plus the classification fields; any other
+    keys on `item` are not copied.
     """
-    profile = policy[item["type"]]
-    _validate_profile(item["type"], profile)
+    pii_type = item["type"]
+    risk_level, severity_weight, rationale = _resolve_profile(pii_type, policy[pii_type])
 
     return {
-        **item,
-        "risk_level": profile.risk_level,
-        "severity_weight": float(profile.severity_weight),
-        "rationale": profile.rationale,
+        "type": pii_type,
+        "value": item["value"],
+        "file": item["file"],
+        "line_number": item["line_number"],
+        "risk_level": risk_level,
+        "severity_weight": severity_weight,
+        "rationale": rationale,
     }
 
 
@@ -142,9 +185,45 @@ def classify_pii_dicts(
 ) -> list[PiiClassificationDict]:
     """
     Classify a set of detected PII dictionaries into risk level + severity weights.
+
+    Same output as calling `classify_pii_dict` on each item, built inline.
+    """
+    cache = _resolve_policy(policy)
+
+    out: list[PiiClassificationDict] = []
+    for x in items:
+        pii_type = x["type"]
+        risk_level, severity_weight, rationale = cache[pii_type]
+        out.append(
+            {
+                "type": pii_type,
+                "value": x["value"],
+                "file": x["file"],
+                "line_number": x["line_number"],
+                "risk_level": risk_level,
+                "severity_weight": severity_weight,
+                "rationale": rationale,
+            }
+        )
+    return out
+
+
+def classify_pii_matches(
+    matches: Iterable[PiiMatch],
+    *,
+    policy: Mapping[PiiType, PiiRiskProfile] = DEFAULT_POLICY,
+) -> list[ClassifiedMatch]:
     """
-    validate_policy(policy)
-    return [classify_pii_dict(x, policy=policy) for x in items]
+    Classify detected PiiMatch items without converting them to dictionaries.
+
+    Same classification as `classify_pii_dicts`; use `pii_matches_to_dicts` and
+    `classify_pii_dicts` when plain dictionaries are needed.
+    """
+    cache = _resolve_policy(policy)
+    return [
+        ClassifiedMatch(m.pii_type, m.value, m.filename, m.line_number, *cache[m.pii_type])
+        for m in matches
+    ]
 
 
 def classify_pii(items: Sequence[PiiDict], *, policy: Mapping[PiiType, PiiRiskProfile] = DEFAULT_POLICY) -> str:
@@ -158,13 +237,19 @@ def classify_pii(items: Sequence[PiiDict], *, policy: Mapping[PiiType, PiiRiskPr
         return "low"
 
     order: list[RiskLevel] = ["low", "medium", "high", "critical"]
-    highest: RiskLevel = "low"
+    highest = 0
 
+    # Validate and rank each PII type once, on first sight, rather than per item.
+    ranks: dict[str, int] = {}
     for item in items:
-        profile = policy[item["type"]]
-        _validate_profile(item["type"], profile)
-        if order.index(profile.risk_level) > order.index(highest):
-            highest = profile.risk_level
-
-    return highest
+        pii_type = item["type"]
+        rank = ranks.get(pii_type)
+        if rank is None:
+            profile = policy[pii_type]
+            _validate_profile(pii_type, profile)
+            rank = ranks[pii_type] = order.index(profile.risk_level)
+        if rank > highest:
+            highest = rank
+
+    return order[highest]
 
@@ -25,6 +25,7 @@ from __future__ import annotations
 
 from typing import Any, Iterable, Literal, Mapping, Optional, Sequence, TypedDict
 from typing import Any, Iterable, Literal, Mapping, Sequence, TypedDict
+import bisect
 
 
 RiskLabel = Literal["low", "medium", "high", "critical"]
@@ -60,6 +61,12 @@ DEFAULT_LABEL_THRESHOLDS: Mapping[RiskLabel, float] = {
 }
 
 
+# DEFAULT_LABEL_THRESHOLDS as parallel ascending lists, for bisect in risk_label_for_score.
+_DEFAULT_SORTED_THRESHOLDS = sorted(DEFAULT_LABEL_THRESHOLDS.items(), key=lambda kv: kv[1])
+_DEFAULT_THRESHOLD_VALUES: list[float] = [v for _, v in _DEFAULT_SORTED_THRESHOLDS]
+_DEFAULT_THRESHOLD_LABELS: list[RiskLabel] = [k for k, _ in _DEFAULT_SORTED_THRESHOLDS]
+
+
 def _clamp01(x: float) -> float:
     if x < 0.0:
         return 0.0
@@ -76,6 +83,12 @@ def risk_label_for_score(
     """
     Convert a 0-100 score into a label using configurable thresholds.
     """
+    if thresholds is DEFAULT_LABEL_THRESHOLDS:
+        # Scores below the lowest threshold (or NaN) get the lowest label, as below.
+        if not score >= _DEFAULT_THRESHOLD_VALUES[0]:
+            return _DEFAULT_THRESHOLD_LABELS[0]
+        return _DEFAULT_THRESHOLD_LABELS[bisect.bisect_right(_DEFAULT_THRESHOLD_VALUES, score) - 1]
+
     # Ensure deterministic ordering: pick the highest threshold that score meets.
     ordered: Sequence[tuple[RiskLabel, float]] = sorted(thresholds.items(), key=lambda kv: kv[1])
     label: RiskLabel = ordered[0][0]
@@ -85,6 +98,42 @@ def risk_label_for_score(
     return label
 
 
+def _aggregate(
+    items: Iterable[Mapping[str, Any]],
+    default_confidence: float,
+    scored_items: Optional[list[ScoredItemDict]],
+) -> float:
+    """
+    Combine item contributions into the 0-100 score. When scored_items is a list, the
+    per-item breakdown is appended to it; calculate_risk_score passes None to skip it.
+    """
+    product_not_risky = 1.0
+
+    for raw in items:
+        if "severity_weight" not in raw:
+            raise KeyError("Each item must include 'severity_weight' (0..1).")
+
+        # Inlined _clamp01; the product of two clamped values needs no third clamp.
+        sev = float(raw["severity_weight"])
+        sev = 0.0 if sev < 0.0 else 1.0 if sev > 1.0 else sev
+        conf = float(raw.get("confidence", default_confidence))
+        conf = 0.0 if conf < 0.0 else 1.0 if conf > 1.0 else conf
+        contribution = sev * conf
+
+        # Combine risks with diminishing returns, capped at 1.0.
+        product_not_risky *= 1.0 - contribution
+
+        if scored_items is not None:
+            scored_items.append({**raw, "contribution": contribution})  # type: ignore[misc]
+
+    if product_not_risky < 0.0:
+        product_not_risky = 0.0
+    elif product_not_risky > 1.0:
+        product_not_risky = 1.0
+    combined_risk = 1.0 - product_not_risky
+    return float(round(combined_risk * 100.0, 2))
+
+
 def score_pii_findings(
     items: Iterable[Mapping[str, Any]],
     *,
@@ -101,25 +150,7 @@ def score_pii_findings(
     Any additional keys (type/value/file/line_number/rationale/...) are preserved in the breakdown.
     """
     scored_items: list[ScoredItemDict] = []
-    product_not_risky = 1.0
-
-    for raw in items:
-        if "severity_weight" not in raw:
-            raise KeyError("Each item must include 'severity_weight' (0..1).")
-
-        sev = _clamp01(float(raw["severity_weight"]))
-        conf = _clamp01(float(raw.get("confidence", default_confidence)))
-        contribution = _clamp01(sev * conf)
-
-        # Combine risks with diminishing returns, capped at 1.0.
-        product_not_risky *= (1.0 - contribution)
-
-        scored: ScoredItemDict = dict(raw)  # type: ignore[assignment]
-        scored["contribution"] = float(contribution)
-        scored_items.append(scored)
-
-    combined_risk = 1.0 - _clamp01(product_not_risky)
-    score = float(round(combined_risk * 100.0, 2))
+    score = _aggregate(items, default_confidence, scored_items)
     label = risk_label_for_score(score, thresholds=thresholds)
 
     explanation = (
@@ -142,6 +173,5 @@ def calculate_risk_score(items: Iterable[Mapping[str, Any]]) -> float:
     Convenience wrapper that returns only the numeric risk score for a list of
     PII-like items.
     """
-    result = score_pii_findings(items)
-    return float(result["score"])
-
+    # Same score as score_pii_findings(items)["score"], without the per-item breakdown.
+    return _aggregate(items, 1.0, None)
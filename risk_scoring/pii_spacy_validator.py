@@ -13,9 +13,17 @@ This module intentionally:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Literal, Optional, Sequence, TypedDict
+from typing import Callable, Iterable, Literal, Optional, Sequence, TypedDict
+import bisect
+import functools
+import operator
 import re
 
+try:
+    import re2  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    re2 = None
+
 from pii_detection.file_scanner import LineRecord
 from pii_detection.pii_detector import PiiDict, PiiType
 
@@ -34,62 +42,262 @@ class PiiValidationDict(TypedDict):
     reason: str
 
 
-_DUMMY_CONTEXT_RE = re.compile(
-    r"""
-    \b(
-      example|e\.g\.|eg|sample|dummy|fake|fictional|placeholder|test|testing|demo|
-      lorem|ipsum|mock|fixture|seed|stub|not\s+real|for\s+example|like\s+this
-    )\b
-    """,
-    flags=re.IGNORECASE | re.VERBOSE,
-)
+# Context keyword patterns. Built from one source per keyword class so the same text
+# feeds Python `re` and the optional RE2 Set below. Only the dummy keywords contain
+# whitespace, so only their builder takes `ws`, the engine's whitespace token.
+def _dummy_context_src(ws: str) -> str:
+    return (
+        r"\b("
+        r"example|e\.g\.|eg|sample|dummy|fake|fictional|placeholder|test|testing|demo|"
+        r"lorem|ipsum|mock|fixture|seed|stub|not" + ws + "+real|for" + ws + "+example|like" + ws + "+this"
+        r")\b"
+    )
 
-_REAL_CONTEXT_RE = re.compile(
-    r"""
-    \b(
-      contact|call|reach|email|mail|phone|mobile|whatsapp|support|helpdesk|
-      customer|client|employee|user|applicant|verification|otp|kyc|uidai|aadhaar
-    )\b
-    """,
-    flags=re.IGNORECASE | re.VERBOSE,
+
+_REAL_CONTEXT_SRC = (
+    r"\b("
+    r"contact|call|reach|email|mail|phone|mobile|whatsapp|support|helpdesk|"
+    r"customer|client|employee|user|applicant|verification|otp|kyc|uidai|aadhaar"
+    r")\b"
 )
 
+
+_DUMMY_CONTEXT_RE = re.compile(_dummy_context_src(r"\s"), flags=re.IGNORECASE)
+
+_REAL_CONTEXT_RE = re.compile(_REAL_CONTEXT_SRC, flags=re.IGNORECASE)
+
+# Case-sensitive twins for already-lowercased ASCII sentences; case-folding during the
+# scan is what makes IGNORECASE slow. Non-ASCII text keeps the patterns above, since
+# str.lower() is not the same mapping as IGNORECASE there (e.g. "\u017f", "\u0130").
+_DUMMY_CONTEXT_LOWER_RE = re.compile(_dummy_context_src(r"\s"))
+
+_REAL_CONTEXT_LOWER_RE = re.compile(_REAL_CONTEXT_SRC)
+
+# Optional (requires google-re2): both keyword classes in one RE2 Set, so a sentence
+# is scanned once in linear time. RE2's \b and \w are ASCII-only, so the Set is only
+# used for ASCII sentences, where they agree with Python's; `ws` spells out Python's
+# ASCII whitespace, which RE2's \s does not fully cover.
+_DUMMY_CONTEXT_ID, _REAL_CONTEXT_ID = 0, 1
+
+
+def _build_context_set():
+    if re2 is None:
+        return None
+    context_set = re2.Set.SearchSet(re2.Options())
+    ws = r"[\t\n\x0b\x0c\r\x1c-\x1f ]"
+    context_set.Add(_dummy_context_src(ws))
+    context_set.Add(_REAL_CONTEXT_SRC)
+    context_set.Compile()
+    return context_set
+
+
+_CONTEXT_SET = _build_context_set()
+
+
+def _context_signals(sentence: str, sent_lower: str) -> tuple[bool, bool]:
+    """
+    Return (has_dummy_keywords, has_real_keywords) for a sentence and its lowercase form.
+    """
+    if sentence.isascii():
+        if _CONTEXT_SET is not None:
+            ids = _CONTEXT_SET.Match(sent_lower) or ()
+            return _DUMMY_CONTEXT_ID in ids, _REAL_CONTEXT_ID in ids
+        return (
+            _DUMMY_CONTEXT_LOWER_RE.search(sent_lower) is not None,
+            _REAL_CONTEXT_LOWER_RE.search(sent_lower) is not None,
+        )
+    return (
+        _DUMMY_CONTEXT_RE.search(sentence) is not None,
+        _REAL_CONTEXT_RE.search(sentence) is not None,
+    )
+
+
 _DUMMY_EMAIL_DOMAIN_RE = re.compile(
     r"(?i)@(?:example\.com|example\.org|example\.net|test\.com|invalid|localhost)\b"
 )
 
 
+# Byte values to delete so that only ASCII digits remain (see _digits_only).
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+
 def _digits_only(s: str) -> str:
-    return re.sub(r"\D", "", s)
+    if s.isascii():
+        return s.encode("ascii").translate(None, _NON_DIGIT_BYTES).decode("ascii")
+    # Matches re's \d, which also keeps non-ASCII decimal digits.
+    return "".join(filter(str.isdecimal, s))
 
 
-def _looks_like_dummy_number(digits: str) -> bool:
+def _looks_like_dummy_number(digits: str, *, nanp: bool = False) -> bool:
     if len(digits) < 7:
         return True
-    if len(set(digits)) == 1:
+    # nanp=True: the value was written with a +1 country code. Area code and exchange
+    # never start with 0/1, and 555-0100..555-0199 is reserved for fictional use. The
+    # caller decides from the written value, since bare 10/11-digit numbers (Indian or
+    # Chinese mobiles) share these digit shapes.
+    if nanp and len(digits) == 11 and digits[0] == "1":
+        if digits[1] < "2" or digits[4] < "2" or digits[4:9] == "55501":
+            return True
+    # All one repeated digit; a single string compare instead of building a set.
+    if digits[0] * len(digits) == digits:
         return True
     if "000000" in digits or "123456" in digits or "987654" in digits:
         return True
     # Simple ascending / descending runs often used in examples
-    if digits in ("1234567890", "0987654321"):
-        return True
-    return False
+    return digits == "1234567890" or digits == "0987654321"
+
+
+# Per-type value signals: (value, lowercased sentence) -> (score delta, reasons).
+_SignalResult = tuple[int, tuple[str, ...]]
+_NO_SIGNAL: _SignalResult = (0, ())
+
+
+def _email_signals(value: str, sent_lower: str) -> _SignalResult:
+    if _DUMMY_EMAIL_DOMAIN_RE.search(value):
+        return -3, ("example/test email domain",)
+    return _NO_SIGNAL
+
+
+def _phone_signals(value: str, sent_lower: str) -> _SignalResult:
+    if _looks_like_dummy_number(_digits_only(value), nanp=value.lstrip().startswith("+1")):
+        return -2, ("phone number looks like a placeholder pattern",)
+    return _NO_SIGNAL
+
+
+def _aadhaar_signals(value: str, sent_lower: str) -> _SignalResult:
+    delta = 0
+    reasons: list[str] = []
+    digits = _digits_only(value)
+    # Aadhaar-like: also treat obvious sequences/repeats as likely dummy examples
+    if _looks_like_dummy_number(digits) or digits.startswith("1234") or digits.endswith("9012"):
+        delta -= 2
+        reasons.append("aadhaar-like value looks like a common example pattern")
+    if "aadhaar" in sent_lower or "uidai" in sent_lower:
+        delta += 1
+        reasons.append("aadhaar/uidai mentioned nearby")
+    return delta, tuple(reasons)
+
+
+_TYPE_SIGNALS: dict[PiiType, Callable[[str, str], _SignalResult]] = {
+    "email": _email_signals,
+    "phone": _phone_signals,
+    "aadhaar": _aadhaar_signals,
+}
+
+
+_NER_TYPES = frozenset({"email", "phone"})
+
+
+def _score_context(sentence: str, pii_type: str, value: str, ner_hit: bool) -> tuple[Verdict, float, str]:
+    """
+    Combine context, value and NER signals into (verdict, confidence, reason).
+    """
+    sent_lower = sentence.lower()
+
+    score = 0
+    reasons: list[str] = []
+
+    has_dummy, has_real = _context_signals(sentence, sent_lower)
+
+    if has_dummy:
+        score -= 2
+        reasons.append("dummy/example keywords in sentence")
+
+    if has_real:
+        score += 1
+        reasons.append("real-world contact/verification keywords in sentence")
+
+    type_signal = _TYPE_SIGNALS.get(pii_type)
+    if type_signal is not None:
+        delta, type_reasons = type_signal(value, sent_lower)
+        score += delta
+        reasons.extend(type_reasons)
+
+    if ner_hit:
+        score += 1
+        reasons.append("person/org entity present in same sentence")
+
+    # Map score to verdict + confidence; keep uncertain cases lower confidence.
+    if score >= 2:
+        verdict: Verdict = "real"
+        confidence = 0.85
+    elif score <= -2:
+        verdict = "dummy"
+        confidence = 0.85
+    else:
+        verdict = "uncertain"
+        confidence = max(0.25, min(0.75, 0.50 + 0.10 * score))
+
+    reason = "; ".join(reasons) if reasons else "insufficient context signals"
+    return verdict, float(confidence), reason
+
+
+_EMPTY_LINES: dict[int, str] = {}
+
+_SENT_END = operator.itemgetter(1)
 
 
 def _find_sentence_for_value(doc, value: str) -> str:
     # Prefer the sentence that actually contains the matched value.
     v = value.lower()
+
+    # Fast path: locate the first occurrence in the whole doc and take its sentence.
+    # Any earlier sentence containing the value would hold an earlier occurrence, so
+    # this agrees with the scan below whenever the hit lies inside one sentence.
+    if hasattr(doc, "user_data") and v:
+        # Built once per doc and reused by every item on the line: Doc.text, Doc.sents
+        # and Span.text all walk tokens in Python, while slicing the cached text does not.
+        index = doc.user_data.get("_sentence_index")
+        if index is None:
+            text = doc.text
+            text_lower = text.lower()
+            # Offsets only carry over when lowercasing kept the length (e.g. not for "İ").
+            bounds = [(s.start_char, s.end_char) for s in doc.sents] if len(text_lower) == len(text) else None
+            index = doc.user_data["_sentence_index"] = (text, text_lower, bounds)
+        text, text_lower, bounds = index
+        idx = text_lower.find(v)
+        if idx < 0:
+            return text.strip()
+        if bounds is not None:
+            end = idx + len(v)
+            i = bisect.bisect_left(bounds, end, key=_SENT_END)
+            if i < len(bounds) and bounds[i][0] <= idx:
+                return text[bounds[i][0] : bounds[i][1]].strip()
+
     for sent in getattr(doc, "sents", []):
         if v in sent.text.lower():
             return sent.text.strip()
     return doc.text.strip()
 
 
-def _get_default_nlp(model: str = "en_core_web_sm"):
+NlpPurpose = Literal["sents", "ner"]
+
+# Components whose output (POS tags, lemmas) is never read here. The parser is kept
+# for sentence boundaries; "ner" is also dropped when entities are not consulted.
+_UNUSED_PIPES: dict[str, tuple[str, ...]] = {
+    "ner": ("tagger", "attribute_ruler", "lemmatizer"),
+    "sents": ("tagger", "attribute_ruler", "lemmatizer", "ner"),
+}
+
+
+def _get_default_nlp(model: str = "en_core_web_sm", purpose: NlpPurpose = "ner"):
     """
     Load spaCy pipeline. Tries a full model first, then falls back to a blank English
     pipeline with a sentencizer (no custom training).
+
+    purpose="ner" keeps sentences and entities; purpose="sents" keeps sentence
+    boundaries only. Components the purpose does not need are excluded at load time.
+
+    Pipelines are cached per (model, purpose), so repeated calls reuse the loaded
+    pipeline instead of calling spacy.load() again.
     """
+    # Always call the cached loader positionally: lru_cache keys on how arguments are
+    # spelled, so model=m and (m, "ner") would otherwise load the same pipeline twice.
+    return _load_nlp(model, purpose)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_nlp(model: str, purpose: NlpPurpose):
     try:
         import spacy  # type: ignore
     except ModuleNotFoundError as e:  # pragma: no cover
@@ -100,7 +308,7 @@ def _get_default_nlp(model: str = "en_core_web_sm"):
         ) from e
 
     try:
-        nlp = spacy.load(model)
+        nlp = spacy.load(model, exclude=list(_UNUSED_PIPES[purpose]))
     except Exception:
         nlp = spacy.blank("en")
 
@@ -115,6 +323,8 @@ def validate_detected_pii_with_spacy(
     *,
     nlp=None,
     model: str = "en_core_web_sm",
+    batch_size: int = 64,
+    n_process: int = 1,
 ) -> list[PiiValidationDict]:
     """
     Validate detected PII using surrounding sentence context (spaCy).
@@ -122,75 +332,68 @@ def validate_detected_pii_with_spacy(
     Input:
     - pii: list of dictionaries from `pii_detector.detect_pii_dicts(...)`
     - records: original `LineRecord` items used to detect PII (for line text context)
+    - batch_size / n_process: passed to `nlp.pipe(...)`; each distinct line is parsed once
 
     Output:
     - list of dictionaries with additional keys: verdict, confidence, context_sentence, reason
     """
     if nlp is None:
-        nlp = _get_default_nlp(model=model)
-
-    line_lookup: dict[tuple[str, int], str] = {(r.filename, r.line_number): r.line for r in records}
-
+        # Entities only feed the email/phone signal; skip loading NER otherwise.
+        needs_ner = any(item["type"] in ("email", "phone") for item in pii)
+        nlp = _get_default_nlp(model=model, purpose="ner" if needs_ner else "sents")
+
+    # filename -> line_number -> line; two plain lookups per item, no key tuple built.
+    by_file: dict[str, dict[int, str]] = {}
+    for r in records:
+        lines = by_file.get(r.filename)
+        if lines is None:
+            lines = by_file[r.filename] = {}
+        lines[r.line_number] = r.line
+
+    # Parse every distinct context line in one batched nlp.pipe() call instead of
+    # calling nlp(line) per item; lines with several PII items are parsed once.
+    # Blank (or missing) lines are never parsed: they have no sentence or entities.
+    item_lines = [by_file.get(item["file"], _EMPTY_LINES).get(item["line_number"], "") for item in pii]
+    unique_lines = [line for line in dict.fromkeys(item_lines) if line.strip()]
+    pipe = getattr(nlp, "pipe", None)
+    if pipe is not None:
+        docs = pipe(unique_lines, batch_size=batch_size, n_process=n_process)
+    else:
+        docs = map(nlp, unique_lines)
+    line_to_doc = dict(zip(unique_lines, docs))
+
+    person_org_lines: dict[str, bool] = {}
+    verdict_cache: dict[tuple[str, str, str, bool], tuple[Verdict, float, str]] = {}
     out: list[PiiValidationDict] = []
-    for item in pii:
+    for item, line in zip(pii, item_lines):
         pii_type = item["type"]
         value = item["value"]
         filename = item["file"]
         line_number = item["line_number"]
 
-        line = line_lookup.get((filename, line_number), "")
-        doc = nlp(line)
-        sentence = _find_sentence_for_value(doc, value)
-        sent_lower = sentence.lower()
-
-        score = 0
-        reasons: list[str] = []
-
-        if _DUMMY_CONTEXT_RE.search(sentence):
-            score -= 2
-            reasons.append("dummy/example keywords in sentence")
-
-        if _REAL_CONTEXT_RE.search(sentence):
-            score += 1
-            reasons.append("real-world contact/verification keywords in sentence")
-
-        if pii_type == "email":
-            if _DUMMY_EMAIL_DOMAIN_RE.search(value):
-                score -= 3
-                reasons.append("example/test email domain")
-
-        digits = _digits_only(value)
-        if pii_type == "phone":
-            if _looks_like_dummy_number(digits):
-                score -= 2
-                reasons.append("phone number looks like a placeholder pattern")
-        elif pii_type == "aadhaar":
-            # Aadhaar-like: also treat obvious sequences/repeats as likely dummy examples
-            if _looks_like_dummy_number(digits) or digits.startswith("1234") or digits.endswith("9012"):
-                score -= 2
-                reasons.append("aadhaar-like value looks like a common example pattern")
-            if "aadhaar" in sent_lower or "uidai" in sent_lower:
-                score += 1
-                reasons.append("aadhaar/uidai mentioned nearby")
-
-        # Optional NER signal when using a full model: a PERSON/ORG in same sentence
-        ents = getattr(doc, "ents", ())
-        if ents and any(e.label_ in {"PERSON", "ORG"} for e in ents) and pii_type in {"email", "phone"}:
-            score += 1
-            reasons.append("person/org entity present in same sentence")
-
-        # Map score to verdict + confidence; keep uncertain cases lower confidence.
-        if score >= 2:
-            verdict: Verdict = "real"
-            confidence = 0.85
-        elif score <= -2:
-            verdict = "dummy"
-            confidence = 0.85
+        doc = line_to_doc.get(line)
+        if doc is None:
+            sentence = ""
+            ner_hit = False
         else:
-            verdict = "uncertain"
-            confidence = max(0.25, min(0.75, 0.50 + 0.10 * score))
+            sentence = _find_sentence_for_value(doc, value)
+            # Optional NER signal when using a full model: a PERSON/ORG in same sentence
+            ner_hit = False
+            if pii_type in _NER_TYPES:
+                ner_hit = person_org_lines.get(line)
+                if ner_hit is None:
+                    ents = getattr(doc, "ents", ())
+                    ner_hit = person_org_lines[line] = any(e.label_ in {"PERSON", "ORG"} for e in ents)
+
+        # Every signal below depends only on this key, so repeated contexts (duplicate
+        # log lines, CSV rows) are scored once. The value is part of the key because the
+        # type signals inspect it.
+        key = (sentence, pii_type, value, ner_hit)
+        cached = verdict_cache.get(key)
+        if cached is None:
+            cached = verdict_cache[key] = _score_context(sentence, pii_type, value, ner_hit)
+        verdict, confidence, reason = cached
 
-        reason = "; ".join(reasons) if reasons else "insufficient context signals"
         out.append(
             {
                 "type": pii_type,
@@ -198,7 +401,7 @@ def validate_detected_pii_with_spacy(
                 "file": filename,
                 "line_number": line_number,
                 "verdict": verdict,
-                "confidence": float(confidence),
+                "confidence": confidence,
                 "context_sentence": sentence,
                 "reason": reason,
             }
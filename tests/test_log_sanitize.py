@@ -1,8 +1,12 @@
 """Tests for PII-safe log sanitization."""
 
+import json
+
 import pytest
 
-from utils.log_sanitize import REDACTED_PLACEHOLDER, sanitize_for_log
+from pii_detection.pii_detector import PiiMatch
+from risk_scoring.pii_classification import classify_pii_matches
+from utils.log_sanitize import REDACTED_PLACEHOLDER, sanitize_for_log, sanitize_for_log_bytes
 
 
 def test_sanitize_redacts_value_key():
@@ -31,3 +35,56 @@ def test_sanitize_primitive_unchanged():
     assert sanitize_for_log(42) == 42
     assert sanitize_for_log("hello") == "hello"
     assert sanitize_for_log(None) is None
+
+
+def test_sanitize_deeply_nested_structure():
+    nested: object = {"type": "email", "value": "a@b.com"}
+    for _ in range(5000):
+        nested = [nested]
+    out = sanitize_for_log(nested)
+    for _ in range(5000):
+        out = out[0]
+    assert out == {"type": "email", "value": REDACTED_PLACEHOLDER}
+
+
+def test_sanitize_tuples_and_nested_dicts():
+    d = {"meta": ({"value": "9876543210"}, [{"value": "x@y.com", "line_number": 3}])}
+    out = sanitize_for_log(d)
+    assert out == {"meta": ({"value": REDACTED_PLACEHOLDER}, [{"value": REDACTED_PLACEHOLDER, "line_number": 3}])}
+    assert isinstance(out["meta"], tuple)
+
+
+def test_sanitize_for_log_bytes_is_redacted_json():
+    d = [{"type": "email", "value": "user@example.com", "line_number": 4}]
+    out = sanitize_for_log_bytes(d)
+    assert isinstance(out, bytes)
+    assert b"user@example.com" not in out
+    assert json.loads(out) == [{"type": "email", "value": REDACTED_PLACEHOLDER, "line_number": 4}]
+
+
+def test_sanitize_redacts_pii_dataclasses():
+    match = PiiMatch("email", "alice@corp.io", "f.txt", 3)
+    classified = classify_pii_matches([match])[0]
+    payload = {"matches": [match], "classified": (classified,)}
+
+    out = sanitize_for_log(payload)
+    assert out["matches"][0] == {
+        "pii_type": "email",
+        "value": REDACTED_PLACEHOLDER,
+        "filename": "f.txt",
+        "line_number": 3,
+    }
+    assert out["classified"][0]["value"] == REDACTED_PLACEHOLDER
+
+    raw = sanitize_for_log_bytes(payload)
+    assert b"alice@corp.io" not in raw
+    assert json.loads(raw)["classified"][0]["risk_level"] == classified.risk_level
+
+
+def test_sanitize_for_log_bytes_rejects_unknown_objects():
+    class Opaque:
+        def __repr__(self) -> str:
+            return "Opaque(secret='alice@corp.io')"
+
+    with pytest.raises(TypeError):
+        sanitize_for_log_bytes({"x": Opaque()})
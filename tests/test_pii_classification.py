@@ -1,4 +1,14 @@
-from risk_scoring.pii_classification import classify_pii
+import pytest
+
+from pii_detection.pii_detector import PiiMatch, pii_matches_to_dicts
+from risk_scoring.pii_classification import (
+    DEFAULT_POLICY,
+    PiiRiskProfile,
+    classify_pii,
+    classify_pii_dict,
+    classify_pii_dicts,
+    classify_pii_matches,
+)
 
 
 def test_classify_pii_high_risk_for_id_like_items():
@@ -34,3 +44,62 @@ def test_classify_pii_no_pii_returns_low_or_none():
     assert isinstance(result, str)
     assert result.lower() in {"low", "none"}
 
+
+def test_classify_pii_matches_agrees_with_dict_classification():
+    matches = [
+        PiiMatch("email", "dummy.user@example.com", "dummy.txt", 1),
+        PiiMatch("aadhaar", "2222 3333 4444", "dummy.txt", 2),
+    ]
+
+    classified = classify_pii_matches(matches)
+    expected = classify_pii_dicts(pii_matches_to_dicts(matches))
+
+    assert [(c.pii_type, c.line_number, c.risk_level, c.severity_weight) for c in classified] == [
+        (d["type"], d["line_number"], d["risk_level"], d["severity_weight"]) for d in expected
+    ]
+
+
+def test_classify_pii_dict_matches_batch_classification():
+    items = [
+        {"type": "email", "value": "dummy.user@example.com", "file": "dummy.txt", "line_number": 1},
+        {"type": "phone", "value": "555-123-4567", "file": "dummy.txt", "line_number": 2, "confidence": 0.4},
+    ]
+
+    classified = [classify_pii_dict(x) for x in items]
+
+    assert classified == classify_pii_dicts(items)
+    assert classified[1] == {
+        "type": "phone",
+        "value": "555-123-4567",
+        "file": "dummy.txt",
+        "line_number": 2,
+        "risk_level": "high",
+        "severity_weight": 0.70,
+        "rationale": DEFAULT_POLICY["phone"].rationale,
+    }
+
+    bad_policy = {**DEFAULT_POLICY, "email": PiiRiskProfile("medium", 1.5, "too heavy")}
+    with pytest.raises(ValueError, match="severity_weight"):
+        classify_pii_dict(items[0], policy=bad_policy)
+    with pytest.raises(ValueError, match="severity_weight"):
+        classify_pii_dict(items[0], policy=bad_policy)
+
+
+def test_classify_pii_returns_highest_level_and_validates_seen_types():
+    items = [
+        {"type": "email", "value": "a@b.co", "file": "f.txt", "line_number": 1},
+        {"type": "phone", "value": "9876543210", "file": "f.txt", "line_number": 2},
+        {"type": "email", "value": "c@d.co", "file": "f.txt", "line_number": 3},
+    ]
+    policy = {
+        "email": PiiRiskProfile("high", 0.6, "e"),
+        "phone": PiiRiskProfile("medium", 0.5, "p"),
+        # Not present in the items, so never validated.
+        "aadhaar": PiiRiskProfile("critical", 2.0, "a"),
+    }
+
+    assert classify_pii(items, policy=policy) == "high"
+    assert classify_pii(items[1:2], policy=policy) == "medium"
+
+    with pytest.raises(ValueError, match="rationale"):
+        classify_pii(items, policy={**policy, "phone": PiiRiskProfile("low", 0.1, " ")})
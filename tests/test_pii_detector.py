@@ -1,6 +1,14 @@
+import io
 from typing import Any, Dict, List
 
-from pii_detection.pii_detector import detect_pii
+import pytest
+
+from pii_detection import pii_detector
+from pii_detection.pii_detector import (
+    detect_pii,
+    detect_pii_dicts_in_stream,
+    detect_pii_dicts_in_text,
+)
 
 
 def _normalize_results(result: Any) -> List[Dict[str, Any]]:
@@ -78,3 +86,50 @@ def test_detect_pii_multiple_pii_in_single_text():
     assert "phone" in types
     assert len(results) >= 2
 
+
+
+def test_detect_pii_dicts_in_text_reports_line_numbers():
+    text = "no pii here\nmail dummy.user@example.com\n\nid 2345 6789 0123"
+
+    results = detect_pii_dicts_in_text(text, filename="upload.txt")
+
+    assert [(r["type"], r["line_number"]) for r in results] == [("email", 2), ("aadhaar", 4)]
+    assert all(r["file"] == "upload.txt" for r in results)
+
+
+def test_text_splits_lines_like_the_stream_path():
+    # Only \n, \r and \r\n end a line; \f, \x1c, \x85 and U+2028 stay inside it.
+    text = "a@b.co\fnote\x1c\x85x\u2028c@d.co\r\nsecond 2345 6789 0123\rthird\n"
+
+    expected = detect_pii_dicts_in_stream(io.StringIO(text, newline=""), filename="u.txt")
+    assert [(r["type"], r["line_number"]) for r in expected] == [("email", 1), ("email", 1), ("aadhaar", 2)]
+    assert detect_pii_dicts_in_text(text, filename="u.txt") == expected
+
+
+def test_detect_pii_dicts_in_text_long_digit_and_symbol_runs():
+    # Pathological inputs for backtracking engines; pin the results.
+    results = detect_pii_dicts_in_text("0" * 10_000)
+    assert [(r["type"], len(r["value"])) for r in results] == [("phone", 10_000)]
+
+    assert detect_pii_dicts_in_text("0" * 10_000 + "x") == []
+    assert detect_pii_dicts_in_text("+1" * 5_000) == []
+
+
+@pytest.mark.parametrize("use_re2", [True, False])
+def test_detect_pii_dicts_in_text_long_runs_next_to_real_emails(monkeypatch, use_re2):
+    # Lines that do contain an "@"; EMAIL_RE alone takes ~1s on each of these.
+    if not use_re2:
+        monkeypatch.setattr(pii_detector, "_SCANNER", None)
+    elif pii_detector._SCANNER is None:
+        pytest.skip("google-re2 is not installed")
+
+    results = detect_pii_dicts_in_text("+1" * 5_000 + " a@b.co")
+    assert [(r["type"], r["value"]) for r in results] == [("email", "a@b.co")]
+
+    assert detect_pii_dicts_in_text("a." * 5_000 + "@") == []
+
+    results = detect_pii_dicts_in_text("a." * 5_000 + "@b.co x@y.org")
+    assert [(r["type"], len(r["value"])) for r in results] == [("email", 10_005), ("email", 7)]
+
+    line = "." * 5_000 + "a.b-c@d.e.co " + "a." * 5_000
+    assert [r["value"] for r in detect_pii_dicts_in_text(line)] == ["a.b-c@d.e.co"]
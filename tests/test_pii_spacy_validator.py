@@ -1,7 +1,8 @@
 import pytest
 
+from pii_detection.file_scanner import LineRecord
 from risk_scoring import pii_spacy_validator
-from risk_scoring.pii_spacy_validator import validate_with_spacy
+from risk_scoring.pii_spacy_validator import validate_detected_pii_with_spacy, validate_with_spacy
 
 
 def _fake_nlp_with_entities(entities):
@@ -67,3 +68,84 @@ def test_validate_with_spacy_skips_real_spacy_when_unavailable(monkeypatch):
     assert isinstance(results, list)
     assert len(results) >= 1
 
+
+
+def test_validate_detected_pii_flags_fictional_nanp_numbers():
+    values = ["+1 212 555 0150", "+1 212 155 0123", "+91 98555 01234", "13800138000", "18610392745"]
+    records = [LineRecord("f.txt", i, f"Call {v} today") for i, v in enumerate(values, 1)]
+    pii = [{"type": "phone", "value": v, "file": "f.txt", "line_number": i} for i, v in enumerate(values, 1)]
+    results = validate_detected_pii_with_spacy(pii, records, nlp=_fake_nlp_with_entities([]))
+
+    placeholder = "phone number looks like a placeholder pattern"
+    flagged = [placeholder in r["reason"] for r in results]
+    # Only numbers written with +1 get the NANP rules; bare 11-digit mobiles do not.
+    assert flagged == [True, True, False, False, False]
+
+
+def test_default_nlp_loads_each_model_and_purpose_once():
+    pytest.importorskip("spacy")
+    pii_spacy_validator._load_nlp.cache_clear()
+
+    by_keyword = pii_spacy_validator._get_default_nlp(model="no-such-model")
+    explicit = pii_spacy_validator._get_default_nlp(model="no-such-model", purpose="ner")
+    positional = pii_spacy_validator._get_default_nlp("no-such-model", "ner")
+
+    assert by_keyword is explicit is positional
+    assert pii_spacy_validator._load_nlp.cache_info().misses == 1
+    pii_spacy_validator._load_nlp.cache_clear()
+
+
+def _blank_nlp_with_sentencizer():
+    spacy = pytest.importorskip("spacy")
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+@pytest.mark.parametrize(
+    ("line", "value", "expected_sentence"),
+    [
+        # Multi-sentence line: only the sentence holding the value is used.
+        (
+            "Hello there. Please call 98765 43210 for KYC. Thanks!",
+            "98765 43210",
+            "Please call 98765 43210 for KYC.",
+        ),
+        # Value repeated in two sentences: the first one wins.
+        (
+            "Test number 98765 43210 here. Contact 98765 43210 now.",
+            "98765 43210",
+            "Test number 98765 43210 here.",
+        ),
+        # Value straddling a sentence boundary: no sentence holds it, use the line.
+        ("Call 98765. 43210 now.", "98765. 43210", "Call 98765. 43210 now."),
+        # Lowercasing "İ" changes the text length, so char offsets cannot be reused.
+        ("İstanbul office. Reach Alice@Corp.io today.", "Alice@Corp.io", "Reach Alice@Corp.io today."),
+    ],
+)
+def test_validate_detected_pii_picks_context_sentence(line, value, expected_sentence):
+    nlp = _blank_nlp_with_sentencizer()
+    pii_type = "email" if "@" in value else "phone"
+    records = [LineRecord("f.txt", 1, line)]
+    pii = [{"type": pii_type, "value": value, "file": "f.txt", "line_number": 1}]
+
+    results = validate_detected_pii_with_spacy(pii, records, nlp=nlp)
+
+    assert results[0]["context_sentence"] == expected_sentence
+
+
+def test_validate_detected_pii_items_sharing_a_line_get_their_own_sentence():
+    nlp = _blank_nlp_with_sentencizer()
+    line = "Email alice@corp.io for access. Sample phone 98765 43210 is fake."
+    records = [LineRecord("f.txt", 1, line)]
+    pii = [
+        {"type": "email", "value": "alice@corp.io", "file": "f.txt", "line_number": 1},
+        {"type": "phone", "value": "98765 43210", "file": "f.txt", "line_number": 1},
+    ]
+
+    results = validate_detected_pii_with_spacy(pii, records, nlp=nlp)
+
+    assert [r["context_sentence"] for r in results] == [
+        "Email alice@corp.io for access.",
+        "Sample phone 98765 43210 is fake.",
+    ]
@@ -1,6 +1,6 @@
 import pytest
 
-from pii_detection.file_scanner import scan_file
+from pii_detection.file_scanner import scan_bytes, scan_file
 
 
 def test_scan_file_with_dummy_pii(tmp_path):
@@ -37,3 +37,12 @@ def test_scan_file_missing_file_raises_file_not_found(tmp_path):
     with pytest.raises(FileNotFoundError):
         scan_file(str(missing_path))
 
+
+def test_scan_bytes_streams_lines_with_mixed_newlines():
+    data = "first\r\nsecond\rthird\n\nlast".encode("utf-8")
+
+    records = list(scan_bytes(data, filename="upload.txt"))
+
+    assert [r.line for r in records] == ["first", "second", "third", "", "last"]
+    assert [r.line_number for r in records] == [1, 2, 3, 4, 5]
+    assert all(r.filename == "upload.txt" for r in records)
@@ -1,5 +1,6 @@
 """Tests for in-memory TTL storage. No PII is written to disk."""
 
+import threading
 import time
 
 import pytest
@@ -55,3 +56,27 @@ def test_clear_removes_all():
     s1 = temp_storage.add({"a": 1}, ttl_seconds=60)
     temp_storage.clear()
     assert temp_storage.get(s1) is None
+
+
+def test_readding_scan_id_replaces_expiry():
+    sid = temp_storage.add({"old": 1}, scan_id="scan-1", ttl_seconds=0.05)
+    temp_storage.add({"new": 2}, scan_id=sid, ttl_seconds=60)
+    time.sleep(0.1)
+    # The stale expiry for the first add must not evict the replacement.
+    assert temp_storage.get(sid) == {"new": 2}
+
+
+def test_concurrent_adds_are_all_retrievable():
+    ids: list[str] = []
+
+    def worker(n: int) -> None:
+        for i in range(200):
+            ids.append(temp_storage.add({"n": n, "i": i}, ttl_seconds=60))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(temp_storage.get_all_non_expired()) == len(ids) == 1600
+    assert all(temp_storage.get(sid) is not None for sid in ids)
@@ -9,7 +9,17 @@ Privacy & legal motivation:
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+from typing import Any, Iterator, Mapping, Optional
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    orjson = None
 
 # Key that holds the actual PII value in detection/classification dicts.
 PII_VALUE_KEY = "value"
@@ -18,24 +28,148 @@ PII_VALUE_KEY = "value"
 REDACTED_PLACEHOLDER = "[REDACTED]"
 
 
+# Leaf types returned as-is without the Mapping/list/tuple checks (the common case).
+_SCALAR_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+_DICT, _LIST, _TUPLE = 0, 1, 2
+
+
+def _slot_names(cls: type) -> list[str]:
+    names: list[str] = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return names
+
+
+def _attribute_items(obj: Any) -> Optional[Iterator[tuple[str, Any]]]:
+    """
+    (name, value) pairs for objects that carry a PII value as an attribute: any
+    dataclass instance (e.g. PiiMatch, ClassifiedMatch), or another object with a
+    `value` attribute in its __dict__ or __slots__. None for everything else.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return ((f.name, getattr(obj, f.name)) for f in dataclasses.fields(obj))
+    attrs = getattr(obj, "__dict__", None)
+    if isinstance(attrs, dict) and PII_VALUE_KEY in attrs:
+        return iter(list(attrs.items()))
+    slot_names = _slot_names(type(obj))
+    if PII_VALUE_KEY in slot_names:
+        return ((name, getattr(obj, name)) for name in slot_names if hasattr(obj, name))
+    return None
+
+
+def _open_container(obj: Any) -> Optional[list]:
+    """
+    Start a copy of a container: [kind, items iterator, copy, source, pending key].
+    Objects holding a `value` attribute are copied as dicts so the value is redacted.
+    Returns None for anything that is passed through unchanged.
+    """
+    if isinstance(obj, Mapping) and not isinstance(obj, type):
+        return [_DICT, iter(obj.items()), {}, obj, None]
+    if isinstance(obj, list):
+        return [_LIST, iter(obj), [], obj, None]
+    if isinstance(obj, tuple):
+        names = getattr(type(obj), "_fields", None)
+        if isinstance(names, tuple) and PII_VALUE_KEY in names:
+            # namedtuple: keep the tuple shape, blank the `value` position.
+            items = (REDACTED_PLACEHOLDER if n == PII_VALUE_KEY else v for n, v in zip(names, obj))
+            return [_TUPLE, items, [], obj, None]
+        return [_TUPLE, iter(obj), [], obj, None]
+    attr_items = _attribute_items(obj)
+    if attr_items is not None:
+        return [_DICT, attr_items, {}, obj, None]
+    return None
+
+
 def sanitize_for_log(obj: Any) -> Any:
     """
     Return a copy of obj safe for logging: PII value fields are replaced
     with REDACTED_PLACEHOLDER. Nested dicts and lists are processed recursively.
+    Dataclasses (e.g. PiiMatch, ClassifiedMatch) and other objects with a `value`
+    attribute are returned as dicts of their fields, with the value redacted.
 
     Use this whenever you log structures that might contain PII (e.g. from
-    detect_pii_dicts or classify_pii_dicts).
+    detect_pii_dicts, classify_pii_dicts or classify_pii_matches).
+
+    The walk uses an explicit stack, so deeply nested input does not hit the
+    recursion limit; a structure that contains itself raises ValueError.
     """
-    if isinstance(obj, Mapping) and not isinstance(obj, type):
-        out = {}
-        for k, v in obj.items():
-            if k == PII_VALUE_KEY:
-                out[k] = REDACTED_PLACEHOLDER
-            else:
-                out[k] = sanitize_for_log(v)
-        return out
-    if isinstance(obj, list):
-        return [sanitize_for_log(item) for item in obj]
-    if isinstance(obj, tuple):
-        return tuple(sanitize_for_log(item) for item in obj)
-    return obj
+    if type(obj) in _SCALAR_TYPES:
+        return obj
+    frame = _open_container(obj)
+    if frame is None:
+        return obj
+
+    stack = [frame]
+    # ids of containers on the current path (kept alive by their frames), for cycles.
+    active = {id(obj)}
+    while True:
+        frame = stack[-1]
+        kind, items, out = frame[0], frame[1], frame[2]
+        child = None
+        if kind == _DICT:
+            for k, v in items:
+                if k == PII_VALUE_KEY:
+                    out[k] = REDACTED_PLACEHOLDER
+                elif type(v) in _SCALAR_TYPES or (child := _open_container(v)) is None:
+                    out[k] = v
+                else:
+                    frame[4] = k
+                    break
+        else:
+            for v in items:
+                if type(v) in _SCALAR_TYPES or (child := _open_container(v)) is None:
+                    out.append(v)
+                else:
+                    break
+
+        if child is not None:
+            if id(child[3]) in active:
+                raise ValueError("Circular reference detected")
+            active.add(id(child[3]))
+            stack.append(child)
+            continue
+
+        # Container finished: hand the copy to its parent.
+        stack.pop()
+        active.discard(id(frame[3]))
+        result = tuple(out) if kind == _TUPLE else out
+        if not stack:
+            return result
+        parent = stack[-1]
+        if parent[0] == _DICT:
+            parent[2][parent[4]] = result
+        else:
+            parent[2].append(result)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    default= hook for both JSON encoders. Only types with a PII-free, well-defined JSON
+    form are converted; anything else raises TypeError rather than being written via
+    str()/repr(), which could expose values sanitize_for_log does not know about.
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable for logging: {type(obj).__name__}")
+
+
+def sanitize_for_log_bytes(obj: Any) -> bytes:
+    """
+    Return obj sanitized (see sanitize_for_log) and serialized as compact UTF-8 JSON,
+    ready to hand to a log handler. Raises TypeError for values with no JSON form.
+
+    Redaction stays in sanitize_for_log: orjson serializes dicts natively and never
+    passes them to a default= hook, so the hook cannot be used to drop PII values.
+    Without orjson the stdlib encoder is used; its output is equivalent JSON except
+    that non-finite floats are written as NaN/Infinity instead of null.
+    """
+    clean = sanitize_for_log(obj)
+    if orjson is not None:
+        return orjson.dumps(clean, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(clean, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -10,8 +10,10 @@ Privacy & legal motivation:
 
 from __future__ import annotations
 
+import heapq
+import secrets
+import threading
 import time
-import uuid
 from typing import Any, Optional
 
 # Default retention: 10 minutes. Configurable per call to support different policies.
@@ -19,27 +21,34 @@ DEFAULT_TTL_SECONDS = 600
 
 
 def _now() -> float:
-    """Current time in seconds since epoch (for expiry checks)."""
-    return time.time()
+    """Monotonic time in seconds (for expiry checks; unaffected by wall-clock changes)."""
+    return time.monotonic()
 
 
 def _is_expired(stored_at: float, ttl_seconds: float) -> bool:
     return (_now() - stored_at) >= ttl_seconds
 
 
-# In-memory store: list of { "scan_id", "stored_at", "ttl_seconds", "payload" }.
-# We use a list so multiple scans can coexist; each entry has its own timestamp and TTL.
-_storage: list[dict[str, Any]] = []
+# In-memory store: scan_id -> { "scan_id", "stored_at", "ttl_seconds", "payload" }.
+# Multiple scans coexist; each entry has its own timestamp and TTL.
+_storage: dict[str, dict[str, Any]] = {}
+
+# Min-heap of (expires_at, scan_id), so pruning only touches entries that are due.
+# A record whose entry was replaced (same scan_id added again) is skipped when popped.
+_expiry_heap: list[tuple[float, str]] = []
+
+# Guards _storage and _expiry_heap; every public function holds it for its whole body.
+_LOCK = threading.Lock()
 
 
 def _prune_expired() -> None:
-    """Remove all entries that have exceeded their TTL. Call on read and write."""
-    global _storage
+    """Remove all entries that have exceeded their TTL. Call on read and write, holding _LOCK."""
     now = _now()
-    _storage = [
-        e for e in _storage
-        if (now - e["stored_at"]) < e["ttl_seconds"]
-    ]
+    while _expiry_heap and _expiry_heap[0][0] <= now:
+        expires_at, sid = heapq.heappop(_expiry_heap)
+        e = _storage.get(sid)
+        if e is not None and e["stored_at"] + e["ttl_seconds"] == expires_at:
+            del _storage[sid]
 
 
 def add(
@@ -53,22 +62,24 @@ def add(
 
     Args:
         payload: Arbitrary data to store (e.g. list of PII dicts or display payload).
-        scan_id: Optional id for this scan; if not provided, a new UUID is generated.
+        scan_id: Optional id for this scan; if not provided, a random URL-safe token is generated.
         ttl_seconds: Time-to-live in seconds (default 600 = 10 minutes).
 
     Returns:
         The scan_id for this entry (for later retrieval).
     """
-    _prune_expired()
-    sid = scan_id if scan_id is not None else str(uuid.uuid4())
-    entry = {
-        "scan_id": sid,
-        "stored_at": _now(),
-        "ttl_seconds": ttl_seconds,
-        "payload": payload,
-    }
-    _storage.append(entry)
-    return sid
+    with _LOCK:
+        _prune_expired()
+        sid = scan_id if scan_id is not None else secrets.token_urlsafe(16)
+        entry = {
+            "scan_id": sid,
+            "stored_at": _now(),
+            "ttl_seconds": ttl_seconds,
+            "payload": payload,
+        }
+        _storage[sid] = entry
+        heapq.heappush(_expiry_heap, (entry["stored_at"] + ttl_seconds, sid))
+        return sid
 
 
 def get(scan_id: str) -> Optional[Any]:
@@ -80,11 +91,10 @@ def get(scan_id: str) -> Optional[Any]:
     Returns:
         The stored payload, or None if not found or expired.
     """
-    _prune_expired()
-    for e in _storage:
-        if e["scan_id"] == scan_id:
-            return e["payload"]
-    return None
+    with _LOCK:
+        _prune_expired()
+        e = _storage.get(scan_id)
+        return e["payload"] if e is not None else None
 
 
 def get_all_non_expired() -> list[tuple[str, Any]]:
@@ -92,11 +102,13 @@ def get_all_non_expired() -> list[tuple[str, Any]]:
     Return all (scan_id, payload) pairs that are still within TTL.
     Useful for cleanup or auditing count; payloads may still contain PII.
     """
-    _prune_expired()
-    return [(e["scan_id"], e["payload"]) for e in _storage]
+    with _LOCK:
+        _prune_expired()
+        return [(e["scan_id"], e["payload"]) for e in _storage.values()]
 
 
 def clear() -> None:
     """Remove all entries from the store. Use for tests or explicit flush."""
-    global _storage
-    _storage = []
+    with _LOCK:
+        _storage.clear()
+        _expiry_heap.clear()